@@ -1,20 +1,60 @@
+import atexit
+import importlib
 import logging
+import queue
 import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 import requests
 from click_aliases import ClickAliasedGroup
 
 from app.aliases import COMMAND_ALIASES
-from app.commands import check, download, progress, setup, verify
-from app.commands.repl import repl
-from app.commands.version import version
 from app.utils.click import ClickColor, CliContextKey, warn
-from app.utils.version import Version
-from app.version import __version__
+from app.utils.http import DEFAULT_TIMEOUT, get_session
+from app.utils.version import CURRENT_VERSION, Version
+from app.utils.version_cache import get_cached_latest, write_cached_latest
+
+
+# Subcommands are imported only when resolved, so startup pays for the command being run.
+# app.commands.repl imports every command, which keeps them visible to PyInstaller.
+LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "check": ("app.commands.check", "check"),
+    "download": ("app.commands.download", "download"),
+    "progress": ("app.commands.progress.progress", "progress"),
+    "setup": ("app.commands.setup_folder", "setup"),
+    "verify": ("app.commands.verify", "verify"),
+    "version": ("app.commands.version", "version"),
+}
 
 
 class LoggingGroup(ClickAliasedGroup):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, Tuple[str, str]] = {}
+
+    def add_lazy_command(
+        self, name: str, import_path: Tuple[str, str], aliases: List[str]
+    ) -> None:
+        """Registers a command that is imported the first time it is resolved."""
+        self.lazy_commands[name] = import_path
+        if aliases:
+            self._commands[name] = aliases
+            for alias in aliases:
+                self._aliases[alias] = name
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        cmd_name = self.resolve_alias(cmd_name)
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attribute = self.lazy_commands[cmd_name]
+            module = importlib.import_module(module_name)
+            self.add_command(getattr(module, attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
     def invoke(self, ctx: click.Context) -> None:
         logger = logging.getLogger(__name__)
         logger.info("Running command %s with arguments %s", ctx.command_path, sys.argv)
@@ -23,6 +63,109 @@ class LoggingGroup(ClickAliasedGroup):
 
 CONTEXT_SETTINGS = {"max_content_width": 120}
 
+VERSION_CHECK_JOIN_TIMEOUT_SECONDS = 0.1
+
+_version_check_started = False
+_version_check_thread: Optional[threading.Thread] = None
+_version_check_result: "queue.Queue[Tuple[Version, str]]" = queue.Queue(maxsize=1)
+
+
+def _fetch_latest_version() -> Optional[str]:
+    """Looks up the latest released version on GitHub and refreshes the on-disk cache."""
+    try:
+        response = get_session().get(
+            "https://github.com/git-mastery/app/releases/latest",
+            allow_redirects=False,
+            timeout=DEFAULT_TIMEOUT,
+        )
+    except requests.RequestException:
+        return None
+
+    location = response.headers.get("Location")
+    if location is None:
+        return None
+
+    latest_version = location.rsplit("/", 1)[-1]
+    try:
+        Version.parse_version_string(latest_version)
+    except ValueError:
+        return None
+
+    write_cached_latest(latest_version)
+    return latest_version
+
+
+def _is_behind(current_version: Version, latest_version: str) -> bool:
+    """Returns whether the latest version is newer, ignoring unparseable versions."""
+    try:
+        return current_version.is_behind(Version.parse_version_string(latest_version))
+    except ValueError:
+        return False
+
+
+def _fetch_and_store_if_behind(current_version: Version) -> None:
+    """Runs on the background thread when there is no cached version to warn from."""
+    latest_version = _fetch_latest_version()
+    if latest_version is not None and _is_behind(current_version, latest_version):
+        _version_check_result.put_nowait((current_version, latest_version))
+
+
+def _print_upgrade_warning(current_version: Version, latest_version: str) -> None:
+    warn(
+        click.style(
+            f"Your version of Git-Mastery app {current_version} is behind the latest version {latest_version}.",
+            fg=ClickColor.BRIGHT_RED,
+        )
+    )
+    warn("We strongly recommend upgrading your app.")
+    warn(
+        f"Follow the update guide here: {click.style('https://git-mastery.org/companion-app/index.html#updating-the-git-mastery-app', bold=True)}"
+    )
+
+
+def _print_warning_if_behind() -> None:
+    """Prints the upgrade warning at exit if the background check finished in time."""
+    if _version_check_thread is not None:
+        _version_check_thread.join(timeout=VERSION_CHECK_JOIN_TIMEOUT_SECONDS)
+
+    try:
+        current_version, latest_version = _version_check_result.get_nowait()
+    except queue.Empty:
+        return
+
+    _print_upgrade_warning(current_version, latest_version)
+
+
+def _kick_off_version_check(current_version: Version) -> None:
+    """Warns about a newer release, only going to the network in the background.
+
+    A cached latest version is warned about right away, and a stale one is refreshed
+    for later runs. Without a cache, the lookup runs on a background thread and its
+    warning is printed at exit if it finished in time.
+    """
+    global _version_check_started, _version_check_thread
+    if _version_check_started:
+        return
+    _version_check_started = True
+
+    cached = get_cached_latest()
+    if cached is None:
+        _version_check_thread = threading.Thread(
+            target=_fetch_and_store_if_behind, args=(current_version,), daemon=True
+        )
+        _version_check_thread.start()
+        atexit.register(_print_warning_if_behind)
+        return
+
+    latest_version, is_stale = cached
+    if _is_behind(current_version, latest_version):
+        _print_upgrade_warning(current_version, latest_version)
+    if is_stale:
+        _version_check_thread = threading.Thread(
+            target=_fetch_latest_version, daemon=True
+        )
+        _version_check_thread.start()
+
 
 @click.group(
     cls=LoggingGroup,
@@ -37,36 +180,16 @@ def cli(ctx: click.Context, verbose: bool) -> None:
 
     ctx.obj[CliContextKey.VERBOSE] = verbose
 
-    current_version = Version.parse_version_string(__version__)
-    ctx.obj[CliContextKey.VERSION] = current_version
-    latest_version = (
-        requests.get(
-            "https://github.com/git-mastery/app/releases/latest", allow_redirects=False
-        )
-        .headers["Location"]
-        .rsplit("/", 1)[-1]
-    )
-    if current_version.is_behind(Version.parse_version_string(latest_version)):
-        warn(
-            click.style(
-                f"Your version of Git-Mastery app {current_version} is behind the latest version {latest_version}.",
-                fg=ClickColor.BRIGHT_RED,
-            )
-        )
-        warn("We strongly recommend upgrading your app.")
-        warn(
-            f"Follow the update guide here: {click.style('https://git-mastery.org/companion-app/index.html#updating-the-git-mastery-app', bold=True)}"
-        )
+    ctx.obj[CliContextKey.VERSION] = CURRENT_VERSION
+    _kick_off_version_check(CURRENT_VERSION)
 
     if ctx.invoked_subcommand is None and not ctx.resilient_parsing:
+        from app.commands.repl import repl
+
         ctx.invoke(repl)
 
 
 def start() -> None:
-    commands = [check, download, progress, setup, verify, version]
-    for command in commands:
-        if command.name and command.name in COMMAND_ALIASES:
-            cli.add_command(command, aliases=COMMAND_ALIASES[command.name])
-        else:
-            cli.add_command(command)
+    for name, import_path in LAZY_COMMANDS.items():
+        cli.add_lazy_command(name, import_path, COMMAND_ALIASES.get(name, []))
     cli(obj={})
@@ -1,9 +0,0 @@
-__all__ = ["check", "download", "progress", "repl", "setup", "verify", "version"]
-
-from .check import check
-from .download import download
-from .progress.progress import progress
-from .repl import repl
-from .setup_folder import setup
-from .verify import verify
-from .version import version
@@ -29,13 +29,13 @@ from app.utils.github_cli import (
     get_username,
     has_fork,
 )
-from app.utils.gitmastery import ExercisesRepo, Namespace
+from app.utils.gitmastery import BaseExercisesRepo, Namespace, open_exercises_repo
 
 
 def _download_exercise(
     exercise: str, formatted_exercise: str, download_time: datetime
 ) -> None:
-    with ExercisesRepo() as repo:
+    with open_exercises_repo() as repo:
         info(f"Checking if {exercise} is available")
 
         if not repo.has_file(f"{formatted_exercise}/.gitmastery-exercise.json"):
@@ -124,7 +124,7 @@ def _download_exercise(
 
 
 def _download_hands_on(hands_on: str, formatted_hands_on: str) -> None:
-    with ExercisesRepo() as repo:
+    with open_exercises_repo() as repo:
         info(f"Checking if {hands_on} is available")
 
         hands_on_without_prefix = formatted_hands_on.removeprefix("hp_")
@@ -189,7 +189,7 @@ def _download_hands_on(hands_on: str, formatted_hands_on: str) -> None:
 
 
 def setup_exercise_folder(
-    repo: ExercisesRepo, download_time: datetime, config: ExerciseConfig
+    repo: BaseExercisesRepo, download_time: datetime, config: ExerciseConfig
 ) -> None:
     exercise = config.exercise_name
     formatted_exercise = config.formatted_exercise_name
@@ -27,7 +27,7 @@ from app.utils.click import (
 )
 from app.utils.git import add_all, commit, push
 from app.utils.github_cli import delete_repo, get_prs, get_username, pull_request
-from app.utils.gitmastery import ExercisesRepo
+from app.utils.gitmastery import open_exercises_repo
 
 
 @click.command()
@@ -68,7 +68,7 @@ def reset() -> None:
         # student has already created the sub-folder needed
         rmtree(exercise_config.path / exercise_config.exercise_repo.repo_name)
 
-    with ExercisesRepo() as repo:
+    with open_exercises_repo() as repo:
         formatted_exercise_name = exercise_config.formatted_exercise_name
 
         if len(exercise_config.base_files) > 0:
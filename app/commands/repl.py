@@ -1,9 +1,12 @@
 import cmd
+import functools
 import os
 import shlex
+import shutil
 import subprocess
 import sys
-from typing import List
+from types import MappingProxyType
+from typing import BinaryIO, List, Mapping, Optional
 
 import click
 
@@ -15,18 +18,141 @@ from app.commands.setup_folder import setup
 from app.commands.verify import verify
 from app.commands.version import version
 from app.utils.click import CliContextKey, ClickColor
-from app.utils.version import Version
-from app.version import __version__
+from app.utils.gitmastery import ExercisesRepoCache, close_exercises_repos
+from app.utils.version import CURRENT_VERSION
 
 
-GITMASTERY_COMMANDS = {
-    "check": check,
-    "download": download,
-    "progress": progress,
-    "setup": setup,
-    "verify": verify,
-    "version": version,
-}
+GITMASTERY_COMMANDS: Mapping[str, click.Command] = MappingProxyType(
+    {
+        "check": check,
+        "download": download,
+        "progress": progress,
+        "setup": setup,
+        "verify": verify,
+        "version": version,
+    }
+)
+
+# Names the REPL dispatches to Git-Mastery, derived from the command table above
+_COMMAND_NAMES = frozenset(GITMASTERY_COMMANDS)
+
+# Characters that make shell word splitting differ from a plain whitespace split
+_QUOTE_CHARS = frozenset("\"'\\")
+
+# ANSI escape sequences built once, so error paths only need to format their message
+_ERROR_STYLE = click.style("", fg=ClickColor.BRIGHT_RED, reset=False)
+_WARNING_STYLE = click.style("", fg=ClickColor.BRIGHT_YELLOW, reset=False)
+_RESET_STYLE = "\x1b[0m"
+
+# Bound make_context/invoke per command, resolved once rather than on every dispatch
+_COMMAND_TABLE = MappingProxyType(
+    {
+        name: (command.make_context, command.invoke)
+        for name, command in GITMASTERY_COMMANDS.items()
+    }
+)
+
+
+@functools.cache
+def _general_help_text() -> str:
+    """Build the /help output once, as it does not change during a session."""
+    lines = [
+        click.style("\nGit-Mastery Commands:", bold=True, fg=ClickColor.BRIGHT_CYAN)
+    ]
+    for name, command in GITMASTERY_COMMANDS.items():
+        help_text = (command.help or "No description available.").strip()
+        aliases = COMMAND_ALIASES.get(name, [])
+        alias_str = f" (/{', /'.join(aliases)})" if aliases else ""
+        label = f"/{name}{alias_str}"
+        lines.append(f"  {click.style(f'{label:<25}', bold=True)} {help_text}")
+
+    lines.append(
+        click.style("\nBuilt-in Commands:", bold=True, fg=ClickColor.BRIGHT_CYAN)
+    )
+    for name, desc in [
+        ("/help", "Show this help message"),
+        ("/exit", "Exit the REPL"),
+        ("/quit", "Exit the REPL"),
+    ]:
+        lines.append(f"  {click.style(f'{name:<20}', bold=True)} {desc}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+class _PersistentShell:
+    """Long-lived bash process that runs the REPL's shell commands.
+
+    Commands are sent over a pipe and each one runs in a subshell forked from this
+    process, so shell startup is paid once per session rather than once per command.
+    The subshell keeps commands isolated from each other like `subprocess.run` does,
+    and inherits the REPL's stdin/stdout/stderr so interactive programs still work.
+    """
+
+    def __init__(self, bash_path: str) -> None:
+        self._bash_path = bash_path
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._command_writer: Optional[BinaryIO] = None
+        self._status_reader: Optional[BinaryIO] = None
+
+    def _start(self) -> None:
+        command_read, command_write = os.pipe()
+        status_read, status_write = os.pipe()
+        # Each request is "<cwd>\0<command>\0"; the exit code is reported on the status pipe.
+        # The subshell closes both pipes and unsets the loop variables before running the
+        # command, so neither the command nor any background job it starts can see them.
+        script = (
+            f"while IFS= read -r -d '' __gitmastery_dir <&{command_read}"
+            f" && IFS= read -r -d '' __gitmastery_line <&{command_read}; do"
+            f" (exec {command_read}<&- {status_write}>&-;"
+            ' cd -- "$__gitmastery_dir" &&'
+            ' eval "unset __gitmastery_dir __gitmastery_line; $__gitmastery_line");'
+            f' echo "$?" >&{status_write};'
+            " done"
+        )
+        try:
+            self._process = subprocess.Popen(
+                [self._bash_path, "-c", script],
+                pass_fds=(command_read, status_write),
+            )
+        except OSError:
+            os.close(command_write)
+            os.close(status_read)
+            raise
+        finally:
+            os.close(command_read)
+            os.close(status_write)
+        self._command_writer = os.fdopen(command_write, "wb", buffering=0)
+        self._status_reader = os.fdopen(status_read, "rb")
+
+    def run(self, line: str) -> None:
+        """Run a command line and wait for it to finish."""
+        if self._process is None or self._process.poll() is not None:
+            self.close()
+            self._start()
+        assert self._command_writer is not None and self._status_reader is not None
+
+        self._command_writer.write(
+            os.fsencode(os.getcwd()) + b"\0" + os.fsencode(line) + b"\0"
+        )
+        if not self._status_reader.readline():
+            # The shell itself died, a fresh one is started for the next command
+            self.close()
+
+    def close(self) -> None:
+        """Stop the shell, if it is running."""
+        if self._command_writer is not None:
+            self._command_writer.close()
+            self._command_writer = None
+        if self._process is not None:
+            try:
+                self._process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+        if self._status_reader is not None:
+            self._status_reader.close()
+            self._status_reader = None
 
 
 class GitMasteryREPL(cmd.Cmd):
@@ -56,12 +182,20 @@ Shell commands are also supported.
 
     def __init__(self) -> None:
         super().__init__()
+        self._exercises_repo_cache: ExercisesRepoCache = {}
+        self._last_cwd = ""
+        # Windows, or systems without bash, fall back to a new shell per command
+        bash_path = shutil.which("bash") if os.name != "nt" else None
+        self._shell = _PersistentShell(bash_path) if bash_path else None
         self._update_prompt()
 
     def _update_prompt(self) -> None:
-        """Update prompt to show current directory."""
-        cwd = os.path.basename(os.getcwd()) or os.getcwd()
-        self.prompt = f"gitmastery [{cwd}]> "
+        """Update prompt to show current directory, only rebuilding it if it changed."""
+        cwd = os.getcwd()
+        if cwd == self._last_cwd:
+            return
+        self._last_cwd = cwd
+        self.prompt = f"gitmastery [{os.path.basename(cwd) or cwd}]> "
 
     def postcmd(self, stop: bool, line: str) -> bool:
         """Update prompt after each command."""
@@ -77,50 +211,57 @@ Shell commands are also supported.
 
     def default(self, line: str) -> None:
         """Handle commands not recognized by cmd module."""
-        try:
-            parts = shlex.split(line)
-        except ValueError as e:
-            click.echo(click.style(f"Input error: {e}", fg=ClickColor.BRIGHT_RED))
+        # Only Git-Mastery commands need argv semantics, so avoid running shlex on
+        # plain shell commands
+        parts = line.split(maxsplit=1)
+        if not parts:
             return
 
-        if not parts:
+        command = parts[0]
+        if not _QUOTE_CHARS.isdisjoint(command):
+            # A quoted or escaped first word (e.g. "gitmastery") still needs shlex to
+            # tell whether it names gitmastery; malformed input is left to the shell
+            try:
+                command = shlex.split(line)[0]
+            except (ValueError, IndexError):
+                pass
+
+        if command.lower() != "gitmastery":
+            self._run_shell_command(line)
             return
 
-        command_name = parts[0]
-        args = parts[1:]
-
-        if command_name.lower() == "gitmastery":
-            if not args:
-                return
-            gitmastery_command = resolve_alias(args[0])
-            if gitmastery_command in ("exit", "quit"):
-                return self.do_exit("")  # type: ignore[return-value]
-            elif gitmastery_command == "help":
-                self.do_help("")
-            elif gitmastery_command in GITMASTERY_COMMANDS:
-                self._run_gitmastery_command(gitmastery_command, args[1:])
-            else:
-                click.echo(
-                    click.style(
-                        f"Unknown Git-Mastery command: {gitmastery_command}",
-                        fg=ClickColor.BRIGHT_RED,
-                    )
-                )
+        try:
+            args = shlex.split(parts[1]) if len(parts) > 1 else []
+        except ValueError as e:
+            click.echo(f"{_ERROR_STYLE}Input error: {e}{_RESET_STYLE}")
             return
 
-        self._run_shell_command(line)
+        if not args:
+            return
+        gitmastery_command = resolve_alias(args[0])
+        if gitmastery_command in ("exit", "quit"):
+            return self.do_exit("")  # type: ignore[return-value]
+        elif gitmastery_command == "help":
+            self.do_help("")
+        elif gitmastery_command in _COMMAND_NAMES:
+            self._run_gitmastery_command(gitmastery_command, args[1:])
+        else:
+            click.echo(
+                f"{_ERROR_STYLE}Unknown Git-Mastery command: {gitmastery_command}{_RESET_STYLE}"
+            )
 
     def _run_gitmastery_command(self, command_name: str, args: List[str]) -> None:
         """Execute a gitmastery command."""
-        command = GITMASTERY_COMMANDS[command_name]
+        make_context, invoke = _COMMAND_TABLE[command_name]
         original_cwd = os.getcwd()
         try:
-            ctx = command.make_context(f"/{command_name}", args)
+            ctx = make_context(f"/{command_name}", args)
             ctx.ensure_object(dict)
             ctx.obj[CliContextKey.VERBOSE] = False
-            ctx.obj[CliContextKey.VERSION] = Version.parse_version_string(__version__)
+            ctx.obj[CliContextKey.VERSION] = CURRENT_VERSION
+            ctx.obj[CliContextKey.EXERCISES_REPO_CACHE] = self._exercises_repo_cache
             with ctx:
-                command.invoke(ctx)
+                invoke(ctx)
         except click.ClickException as e:
             e.show()
         except click.Abort:
@@ -128,24 +269,24 @@ Shell commands are also supported.
         except SystemExit:
             pass
         except Exception as e:
-            click.echo(click.style(f"Error: {e}", fg=ClickColor.BRIGHT_RED))
+            click.echo(f"{_ERROR_STYLE}Error: {e}{_RESET_STYLE}")
         finally:
             try:
                 os.chdir(original_cwd)
             except (FileNotFoundError, PermissionError, OSError) as e:
                 click.echo(
-                    click.style(
-                        f"Warning: Could not restore original directory: {e}",
-                        fg=ClickColor.BRIGHT_YELLOW,
-                    )
+                    f"{_WARNING_STYLE}Warning: Could not restore original directory: {e}{_RESET_STYLE}"
                 )
 
     def _run_shell_command(self, line: str) -> None:
-        """Execute a shell command via subprocess."""
+        """Execute a shell command via the persistent shell, or subprocess."""
         try:
-            subprocess.run(line, shell=True)
+            if self._shell is not None:
+                self._shell.run(line)
+            else:
+                subprocess.run(line, shell=True)
         except Exception as e:
-            click.echo(click.style(f"Shell error: {e}", fg=ClickColor.BRIGHT_RED))
+            click.echo(f"{_ERROR_STYLE}Shell error: {e}{_RESET_STYLE}")
 
     def do_cd(self, path: str) -> bool:
         """Change directory."""
@@ -160,21 +301,22 @@ Shell commands are also supported.
         try:
             os.chdir(os.path.expanduser(path))
         except FileNotFoundError:
-            click.echo(
-                click.style(f"Directory not found: {path}", fg=ClickColor.BRIGHT_RED)
-            )
+            click.echo(f"{_ERROR_STYLE}Directory not found: {path}{_RESET_STYLE}")
         except PermissionError:
-            click.echo(
-                click.style(f"Permission denied: {path}", fg=ClickColor.BRIGHT_RED)
-            )
+            click.echo(f"{_ERROR_STYLE}Permission denied: {path}{_RESET_STYLE}")
         except OSError as e:
-            click.echo(
-                click.style(f"Cannot change directory: {e}", fg=ClickColor.BRIGHT_RED)
-            )
+            click.echo(f"{_ERROR_STYLE}Cannot change directory: {e}{_RESET_STYLE}")
         return False
 
+    def close(self) -> None:
+        """Clean up resources held across commands."""
+        close_exercises_repos(self._exercises_repo_cache)
+        if self._shell is not None:
+            self._shell.close()
+
     def do_exit(self, args: str) -> bool:
         """Exit the Git-Mastery REPL."""
+        self.close()
         click.echo(click.style("Goodbye!", fg=ClickColor.BRIGHT_CYAN))
         return True
 
@@ -184,26 +326,7 @@ Shell commands are also supported.
 
     def do_help(self, arg: str) -> bool:
         """Show help for commands."""
-        click.echo(
-            click.style("\nGit-Mastery Commands:", bold=True, fg=ClickColor.BRIGHT_CYAN)
-        )
-        for name, command in GITMASTERY_COMMANDS.items():
-            help_text = (command.help or "No description available.").strip()
-            aliases = COMMAND_ALIASES.get(name, [])
-            alias_str = f" (/{', /'.join(aliases)})" if aliases else ""
-            label = f"/{name}{alias_str}"
-            click.echo(f"  {click.style(f'{label:<25}', bold=True)} {help_text}")
-
-        click.echo(
-            click.style("\nBuilt-in Commands:", bold=True, fg=ClickColor.BRIGHT_CYAN)
-        )
-        for name, desc in [
-            ("/help", "Show this help message"),
-            ("/exit", "Exit the REPL"),
-            ("/quit", "Exit the REPL"),
-        ]:
-            click.echo(f"  {click.style(f'{name:<20}', bold=True)} {desc}")
-        click.echo()
+        click.echo(_general_help_text())
         return False
 
     def emptyline(self) -> bool:
@@ -224,5 +347,6 @@ def repl() -> None:
     try:
         repl_instance.cmdloop()
     except KeyboardInterrupt:
+        repl_instance.close()
         click.echo(click.style("\nInterrupted. Goodbye!", fg=ClickColor.BRIGHT_CYAN))
         sys.exit(0)
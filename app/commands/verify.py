@@ -29,7 +29,7 @@ from app.utils.click import (
 )
 from app.utils.git import add_all, commit, push
 from app.utils.github_cli import get_prs, get_username, pull_request
-from app.utils.gitmastery import ExercisesRepo, Namespace
+from app.utils.gitmastery import Namespace, open_exercises_repo
 
 
 def _get_output_status_text(output: GitAutograderOutput) -> str:
@@ -145,7 +145,7 @@ def _execute_verify(
     formatted_exercise_name: str,
     started_at: datetime,
 ) -> GitAutograderOutput:
-    with ExercisesRepo() as repo:
+    with open_exercises_repo() as repo:
         try:
             os.chdir(exercise_path)
             exercise = GitAutograderExercise(exercise_path)
@@ -6,6 +6,7 @@ from typing import Self, Type, Optional, Union
 from app.configs.utils import read_config
 
 GITMASTERY_CONFIG_NAME = ".gitmastery.json"
+EXERCISES_FETCH_METHODS = ("clone", "tarball")
 
 
 @dataclass
@@ -20,6 +21,9 @@ class GitMasteryConfig:
         branch: Optional[str] = "main"
         # local field
         repo_path: Optional[str] = None
+        # how remote sources are fetched: "clone" (sparse git clone) or "tarball"
+        # (a single download of the branch archive)
+        fetch_method: Optional[str] = "clone"
 
         def to_url(self) -> str:
             if self.type == "local":
@@ -28,6 +32,10 @@ class GitMasteryConfig:
                 raise ValueError("Username and repository are both required for remote ExercisesSource")
             return f"https://github.com/{self.username}/{self.repository}.git"
 
+        def to_archive_url(self) -> str:
+            repo_url = self.to_url().removesuffix(".git")
+            return f"{repo_url}/archive/refs/heads/{self.branch}.tar.gz"
+
         @classmethod
         def from_raw(cls, raw: Union["GitMasteryConfig.ExercisesSource", dict, None]) -> "GitMasteryConfig.ExercisesSource":
             # Pass-through if already the correct instance
@@ -41,11 +49,15 @@ class GitMasteryConfig:
                 if typ == "local":
                     return cls(type="local", repo_path=raw.get("repo_path"))
                 # fallthrough for None (legacy)/detected remote
+                fetch_method = raw.get("fetch_method", "clone")
+                if fetch_method not in EXERCISES_FETCH_METHODS:
+                    raise ValueError(f"Unsupported exercises_source fetch_method: {fetch_method!r}")
                 return cls(
                     type="remote",
                     username=raw.get("username", "git-mastery"),
                     repository=raw.get("repository", "exercises"),
                     branch=raw.get("branch", "main"),
+                    fetch_method=fetch_method,
                 )
             raise ValueError("Unsupported exercises_source shape")
 
@@ -61,7 +73,11 @@ class GitMasteryConfig:
         return json.dumps(
             self,
             default=lambda o: {
-                k: v for k, v in o.__dict__.items() if k not in ("path", "cds")
+                k: v
+                for k, v in o.__dict__.items()
+                if k not in ("path", "cds")
+                # fetch_method only applies to remote exercises sources
+                and not (k == "fetch_method" and getattr(o, "type", None) == "local")
             },
             indent=2,
         )
@@ -26,7 +26,10 @@ def in_gitmastery_root(
                 )
 
             path, cds = root
-            config = GitMasteryConfig.read(path, cds)
+            try:
+                config = GitMasteryConfig.read(path, cds)
+            except ValueError as e:
+                error(f"Invalid {GITMASTERY_CONFIG_NAME}: {e}")
 
             if must and cds != 0:
                 error(
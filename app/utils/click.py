@@ -16,6 +16,7 @@ class CliContextKey(StrEnum):
     GITMASTERY_EXERCISE_CONFIG = "GITMASTERY_EXERCISE_CONFIG"
     VERBOSE = "VERBOSE"
     VERSION = "VERSION"
+    EXERCISES_REPO_CACHE = "EXERCISES_REPO_CACHE"
 
 
 class ClickColor(StrEnum):
@@ -1,24 +1,45 @@
+import hashlib
+import importlib.abc
+import importlib.util
 import inspect
+import io
 import os
 import sys
+import tarfile
 import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.machinery import ModuleSpec
 from pathlib import Path
+from types import CodeType, ModuleType
 from typing import (
     Any,
     Dict,
+    Iterable,
+    Iterator,
+    List,
     Optional,
+    Sequence,
     Self,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 import shutil
 
-from git import Repo
+import click
+from git import GitCommandError, Repo
 
-from app.configs.gitmastery_config import GIT_MASTERY_EXERCISES_SOURCE
-from app.utils.click import get_gitmastery_root_config, info
+from app.configs.gitmastery_config import (
+    GIT_MASTERY_EXERCISES_SOURCE,
+    GitMasteryConfig,
+)
+from app.utils.click import CliContextKey, get_gitmastery_root_config, info
 from app.utils.general import ensure_str
+from app.utils.http import DEFAULT_TIMEOUT, get_session
 
 T = TypeVar("T")
 
@@ -35,23 +56,178 @@ EXERCISE_UTILS_FILES = [
     "exercise_config",
 ]
 
+# Directories that are checked out in full when the exercises repo is cloned
+PREFETCHED_DIRECTORIES = ["exercise_utils"]
+# Prefix of the paths given to modules loaded from the exercises repository
+EXERCISES_VIRTUAL_ROOT = "<exercises>"
+
+
+def _get_exercises_source() -> GitMasteryConfig.ExercisesSource:
+    gitmastery_config = get_gitmastery_root_config()
+    if gitmastery_config is not None:
+        return gitmastery_config.exercises_source
+    return GIT_MASTERY_EXERCISES_SOURCE
+
 
-def _clear_exercise_utils_modules() -> None:
+def _clear_exercise_utils_modules(module_names: Iterable[str]) -> None:
     """Clear cached exercise_utils modules from sys.modules.
 
     This is especially important in REPL context where modules persist
-    between command invocations.
+    between command invocations. Only the given names are removed, so there is no
+    need to scan all of sys.modules.
     """
-    modules_to_remove = [
-        key
-        for key in sys.modules
-        if key == "exercise_utils" or key.startswith("exercise_utils.")
-    ]
-    for mod in modules_to_remove:
-        del sys.modules[mod]
+    for module_name in module_names:
+        sys.modules.pop(module_name, None)
+
+
+@contextmanager
+def _no_bytecode() -> Iterator[None]:
+    """Disables writing .pyc files, restoring the previous setting even on errors."""
+    previous = sys.dont_write_bytecode
+    sys.dont_write_bytecode = True
+    try:
+        yield
+    finally:
+        sys.dont_write_bytecode = previous
+
+
+@dataclass
+class FetchedFile:
+    # Git blob id of the contents, used to key compiled code
+    sha: str
+    contents: bytes
+
+
+def _git_blob_sha(contents: bytes) -> str:
+    return hashlib.sha1(b"blob %d\0" % len(contents) + contents).hexdigest()
+
+
+def _read_bytes(path: Union[str, Path]) -> bytes:
+    """Reads a whole file with a single unbuffered read sized from fstat."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _decode_text(contents: bytes) -> str:
+    """Decodes text contents, normalizing newlines as text mode reads would."""
+    return contents.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+@lru_cache(maxsize=64)
+def _compile_source(sha: str, path: str, src: str) -> CodeType:
+    """Compiles source once per blob so repeated loads (e.g. in the REPL) skip the compiler."""
+    return compile(src, path, "exec")
 
 
-class ExercisesRepo:
+class _InMemoryModuleFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Serves the exercise_utils package from source held in memory.
+
+    Modules are only executed when first imported, so the utils files can import
+    each other in whatever order they need. Their __file__ is a virtual
+    "<exercises>/..." path, so exercise_utils must not read files relative to it.
+    """
+
+    def __init__(self, sources: Dict[str, Tuple[str, str]]) -> None:
+        # Fully qualified module name -> (blob sha, source code)
+        self.sources = sources
+        # Names of the modules this finder has created, for cleanup
+        self.installed_modules: List[str] = []
+
+    def _filename(self, fullname: str) -> str:
+        # Virtual path that is never mistaken for a real file on disk
+        if fullname == "exercise_utils":
+            return f"{EXERCISES_VIRTUAL_ROOT}/exercise_utils/__init__.py"
+        return f"{EXERCISES_VIRTUAL_ROOT}/{fullname.replace('.', '/')}.py"
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        if fullname not in self.sources:
+            return None
+        spec = importlib.util.spec_from_loader(
+            fullname,
+            self,
+            origin=self._filename(fullname),
+            is_package=fullname == "exercise_utils",
+        )
+        if spec is not None:
+            # Sets __file__ to the virtual path, as there is no file behind the module
+            spec.has_location = True
+        return spec
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        self.installed_modules.append(spec.name)
+        return None
+
+    def exec_module(self, module: ModuleType) -> None:
+        sha, source = self.sources[module.__name__]
+        exec(
+            _compile_source(sha, self._filename(module.__name__), source),
+            module.__dict__,
+        )
+
+    def get_source(self, fullname: str) -> Optional[str]:
+        if fullname not in self.sources:
+            return None
+        return self.sources[fullname][1]
+
+
+class BaseExercisesRepo(ABC):
+    """Read-only access to the files of the exercises repository.
+
+    Implementations are used as context managers, and files can only be read while
+    the repository is entered.
+    """
+
+    @abstractmethod
+    def has_file(self, file_path: Union[str, Path]) -> bool: ...
+
+    @abstractmethod
+    def fetch_file_contents(
+        self, file_path: Union[str, Path], is_binary: bool
+    ) -> str | bytes: ...
+
+    @abstractmethod
+    def batch_fetch(self, file_paths: List[str]) -> Dict[str, FetchedFile]: ...
+
+    @abstractmethod
+    def download_file(
+        self,
+        file_path: Union[str, Path],
+        download_to_path: Union[str, Path],
+        is_binary: bool,
+    ) -> None: ...
+
+    @staticmethod
+    def _write_contents(
+        download_to_path: Union[str, Path], contents: str | bytes
+    ) -> None:
+        if isinstance(contents, bytes):
+            with open(download_to_path, "wb") as file:
+                file.write(contents)
+        else:
+            with open(download_to_path, "w") as file:
+                file.write(contents)
+
+    @abstractmethod
+    def __enter__(self) -> Self: ...
+
+    @abstractmethod
+    def __exit__(
+        self,
+        exc_type: type | None,
+        exc_val: BaseException | None,
+        exc_tb: object | None,
+    ) -> None: ...
+
+
+class ExercisesRepo(BaseExercisesRepo):
     def __init__(self) -> None:
         """Creates a sparse clone of the exercises repository.
 
@@ -63,6 +239,11 @@ class ExercisesRepo:
 
         self.__repo: Optional[Repo] = None
         self.__temp_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._checked_out: set[str] = set()
+        self._prefetched: set[str] = set()
+        # Local sources may contain uncommitted changes, so they are read from the
+        # working tree. Remote clones are read straight from the object database.
+        self._is_local = False
 
     @property
     def repo(self) -> Repo:
@@ -70,19 +251,91 @@ class ExercisesRepo:
         return self.__repo
 
     def checkout(self, file_path: Union[str, Path]) -> None:
-        self.repo.git.sparse_checkout("set", "--skip-checks", file_path)
+        self.checkout_many([file_path])
+
+    def checkout_many(self, file_paths: Iterable[Union[str, Path]]) -> None:
+        """Adds the given paths to the sparse checkout in a single git call.
+
+        Paths that were already checked out, or that live under a prefetched
+        directory, are skipped. As `sparse-checkout set` replaces the existing
+        patterns, all previously checked out paths are passed along so they remain
+        on disk.
+        """
+        new_paths = {
+            Path(file_path).as_posix()
+            for file_path in file_paths
+            if Path(file_path).parts[0] not in self._prefetched
+        }
+        if new_paths <= self._checked_out:
+            return
+        checked_out = self._checked_out | new_paths
+        self.repo.git.sparse_checkout("set", "--skip-checks", *sorted(checked_out))
+        self._checked_out = checked_out
+
+    def _blob_ref(self, file_path: Union[str, Path]) -> str:
+        return f"HEAD:{Path(file_path).as_posix()}"
 
     def has_file(self, file_path: Union[str, Path]) -> bool:
+        if not self._is_local:
+            try:
+                self.repo.git.cat_file("-e", self._blob_ref(file_path))
+            except GitCommandError:
+                return False
+            return True
+
         self.checkout(file_path)
         return os.path.exists(Path(self.repo.working_dir) / file_path)
 
     def fetch_file_contents(
         self, file_path: Union[str, Path], is_binary: bool
     ) -> str | bytes:
+        if not self._is_local:
+            contents = self.repo.git.cat_file(
+                "blob",
+                self._blob_ref(file_path),
+                stdout_as_string=False,
+                strip_newline_in_stdout=False,
+            )
+            return contents if is_binary else _decode_text(contents)
+
         self.checkout(file_path)
-        read_mode = "rb" if is_binary else "rt"
-        with open(Path(self.repo.working_dir) / file_path, read_mode) as file:
-            return file.read()
+        contents = _read_bytes(Path(self.repo.working_dir) / file_path)
+        return contents if is_binary else _decode_text(contents)
+
+    def batch_fetch(self, file_paths: List[str]) -> Dict[str, FetchedFile]:
+        """Fetches the raw contents of several files at once.
+
+        Remote clones read every blob through a single long-lived `git cat-file --batch`
+        process instead of spawning one git process per file.
+
+        :param file_paths: Paths of the files relative to the repository root
+        :type file_paths: List[str]
+        :return: Mapping of each given path to its blob sha and contents
+        :rtype: Dict[str, FetchedFile]
+        :raises FileNotFoundError: If any of the files does not exist
+        """
+        if self._is_local:
+            self.checkout_many(file_paths)
+            local_files: Dict[str, FetchedFile] = {}
+            for file_path in file_paths:
+                data = _read_bytes(Path(self.repo.working_dir) / file_path)
+                local_files[file_path] = FetchedFile(_git_blob_sha(data), data)
+            return local_files
+
+        # Every blob is read through GitPython's persistent `git cat-file --batch`
+        # process, which is started once and reused for the rest of the session
+        files: Dict[str, FetchedFile] = {}
+        for file_path in file_paths:
+            try:
+                sha, _, _, data = self.repo.git.get_object_data(
+                    self._blob_ref(file_path)
+                )
+            except ValueError as e:
+                raise FileNotFoundError(
+                    f"File not found in exercises repo: {file_path}"
+                ) from e
+            files[file_path] = FetchedFile(ensure_str(sha), data)
+        return files
 
     def download_file(
         self,
@@ -90,24 +343,32 @@ class ExercisesRepo:
         download_to_path: Union[str, Path],
         is_binary: bool,
     ) -> None:
-        contents = self.fetch_file_contents(file_path, is_binary)
-        if is_binary:
-            assert isinstance(contents, bytes)
-            with open(download_to_path, "wb") as file:
-                file.write(contents)
-        else:
-            assert isinstance(contents, str)
-            with open(download_to_path, "w+") as file:
-                file.write(contents)
+        if is_binary and not self._is_local:
+            # Stream the blob straight from git into the destination file, removing it
+            # again if the read fails so no partial file is left behind
+            file = open(download_to_path, "wb")
+            try:
+                with file:
+                    self.repo.git.cat_file(
+                        "blob", self._blob_ref(file_path), output_stream=file
+                    )
+            except BaseException as e:
+                os.unlink(download_to_path)
+                if isinstance(e, GitCommandError) and not self.has_file(file_path):
+                    raise FileNotFoundError(
+                        f"File not found in exercises repo: {file_path}"
+                    ) from e
+                raise
+            return
+
+        self._write_contents(
+            download_to_path, self.fetch_file_contents(file_path, is_binary)
+        )
 
     def __enter__(self) -> Self:
         self.__temp_dir = tempfile.TemporaryDirectory()
 
-        gitmastery_config = get_gitmastery_root_config()
-        if gitmastery_config is not None:
-            exercises_source = gitmastery_config.exercises_source
-        else:
-            exercises_source = GIT_MASTERY_EXERCISES_SOURCE
+        exercises_source = _get_exercises_source()
 
         if exercises_source.type == "local":
             # copy local repo into temp dir for isolation
@@ -119,6 +380,7 @@ class ExercisesRepo:
                 raise FileNotFoundError(f"Local exercises source not found: {src}")
             shutil.copytree(src, self.__temp_dir.name, dirs_exist_ok=True, symlinks=False, copy_function=shutil.copy2)
             self.__repo = Repo(self.__temp_dir.name)
+            self._is_local = True
         else:
             info(
                 f"Fetching exercise information from {exercises_source.to_url()} on branch {exercises_source.branch}"
@@ -131,6 +393,10 @@ class ExercisesRepo:
                 branch=exercises_source.branch,
                 multi_options=["--filter=blob:none", "--sparse"],
             )
+
+        # Also pulls the blobs of remote clones into the object database in one fetch
+        self.checkout_many(PREFETCHED_DIRECTORIES)
+        self._prefetched = set(PREFETCHED_DIRECTORIES)
         return self
 
     def __exit__(
@@ -139,59 +405,200 @@ class ExercisesRepo:
         exc_val: BaseException | None,
         exc_tb: object | None,
     ) -> None:
+        if self.__repo is not None:
+            # Stops the persistent git processes before their working directory goes away
+            self.__repo.close()
         if self.__temp_dir is not None:
             self.__temp_dir.cleanup()
 
 
+class TarballExercisesRepo(BaseExercisesRepo):
+    def __init__(self) -> None:
+        """Serves a remote exercises repository from its branch archive.
+
+        The whole branch is fetched with a single HTTP request and kept in memory, so
+        no clone, sparse checkout or git process is needed to read files. Enabled by
+        setting "fetch_method" to "tarball" in the exercises source config.
+        """
+
+        self._archive: Optional[tarfile.TarFile] = None
+        # Path relative to the repository root -> archive member
+        self._members: Dict[str, tarfile.TarInfo] = {}
+
+    def _read(self, file_path: Union[str, Path]) -> bytes:
+        member = self._members.get(Path(file_path).as_posix())
+        assert self._archive is not None
+        file = self._archive.extractfile(member) if member is not None else None
+        if file is None:
+            raise FileNotFoundError(f"File not found in exercises repo: {file_path}")
+        with file:
+            return file.read()
+
+    def has_file(self, file_path: Union[str, Path]) -> bool:
+        return Path(file_path).as_posix() in self._members
+
+    def fetch_file_contents(
+        self, file_path: Union[str, Path], is_binary: bool
+    ) -> str | bytes:
+        contents = self._read(file_path)
+        return contents if is_binary else _decode_text(contents)
+
+    def batch_fetch(self, file_paths: List[str]) -> Dict[str, FetchedFile]:
+        files: Dict[str, FetchedFile] = {}
+        for file_path in file_paths:
+            contents = self._read(file_path)
+            files[file_path] = FetchedFile(_git_blob_sha(contents), contents)
+        return files
+
+    def download_file(
+        self,
+        file_path: Union[str, Path],
+        download_to_path: Union[str, Path],
+        is_binary: bool,
+    ) -> None:
+        self._write_contents(
+            download_to_path, self.fetch_file_contents(file_path, is_binary)
+        )
+
+    def __enter__(self) -> Self:
+        exercises_source = _get_exercises_source()
+        info(
+            f"Fetching exercise information from {exercises_source.to_url()} on branch {exercises_source.branch}"
+        )
+
+        response = get_session().get(
+            exercises_source.to_archive_url(), timeout=DEFAULT_TIMEOUT
+        )
+        response.raise_for_status()
+
+        self._archive = tarfile.open(fileobj=io.BytesIO(response.content), mode="r:gz")
+        for member in self._archive.getmembers():
+            # Members are nested under a "<repository>-<branch>/" top-level folder
+            _, _, relative_path = member.name.partition("/")
+            if member.isfile() and relative_path:
+                self._members[relative_path] = member
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type | None,
+        exc_val: BaseException | None,
+        exc_tb: object | None,
+    ) -> None:
+        if self._archive is not None:
+            self._archive.close()
+
+
+def _new_exercises_repo(
+    exercises_source: GitMasteryConfig.ExercisesSource,
+) -> BaseExercisesRepo:
+    if exercises_source.type != "local" and exercises_source.fetch_method == "tarball":
+        return TarballExercisesRepo()
+    return ExercisesRepo()
+
+
+# Entered exercises repos keyed by (remote url, branch, fetch method), kept alive by the REPL
+ExercisesRepoCache = Dict[
+    Tuple[str, Optional[str], Optional[str]], BaseExercisesRepo
+]
+
+
+@contextmanager
+def open_exercises_repo() -> Iterator[BaseExercisesRepo]:
+    """Yields an entered exercises repo for the current exercises source.
+
+    When an ExercisesRepoCache is present in the Click context (i.e. in the REPL), the
+    clone of a remote source is reused across commands and only cleaned up by the
+    owner of the cache. Local sources are always copied afresh so that edits made
+    between commands are picked up.
+    """
+    cache: Optional[ExercisesRepoCache] = click.get_current_context().obj.get(
+        CliContextKey.EXERCISES_REPO_CACHE, None
+    )
+    exercises_source = _get_exercises_source()
+    if cache is None or exercises_source.type == "local":
+        with _new_exercises_repo(exercises_source) as repo:
+            yield repo
+        return
+
+    key = (
+        exercises_source.to_url(),
+        exercises_source.branch,
+        exercises_source.fetch_method,
+    )
+    if key not in cache:
+        cache[key] = _new_exercises_repo(exercises_source).__enter__()
+    yield cache[key]
+
+
+def close_exercises_repos(cache: ExercisesRepoCache) -> None:
+    """Cleans up every exercises repo held by the cache."""
+    for repo in cache.values():
+        repo.__exit__(None, None, None)
+    cache.clear()
+
+
 class Namespace:
     def __init__(self, namespace: Dict[str, Any]) -> None:
         self.namespace = namespace
 
     @classmethod
     def load_file_as_namespace(
-        cls: Type[Self], exercises_repo: ExercisesRepo, file_path: Union[str, Path]
+        cls: Type[Self], exercises_repo: BaseExercisesRepo, file_path: Union[str, Path]
     ) -> Self:
-        sys.dont_write_bytecode = True
-        py_file = exercises_repo.fetch_file_contents(file_path, False)
+        exercise_utils_paths = {
+            filename: f"exercise_utils/{filename}.py"
+            for filename in EXERCISE_UTILS_FILES
+        }
+        py_file_path = Path(file_path).as_posix()
+        files = exercises_repo.batch_fetch(
+            [*exercise_utils_paths.values(), py_file_path]
+        )
+        py_file = files[py_file_path]
         namespace: Dict[str, Any] = {}
 
-        # Clear any cached exercise_utils modules to ensure fresh imports
-        _clear_exercise_utils_modules()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = os.path.join(tmpdir, "exercise_utils")
-            os.makedirs(package_root, exist_ok=True)
+        sources = {
+            (
+                "exercise_utils"
+                if filename == "__init__"
+                else f"exercise_utils.{filename}"
+            ): (
+                files[exercise_utils_path].sha,
+                ensure_str(files[exercise_utils_path].contents),
+            )
+            for filename, exercise_utils_path in exercise_utils_paths.items()
+        }
+        finder = _InMemoryModuleFinder(sources)
 
-            for filename in EXERCISE_UTILS_FILES:
-                exercise_utils_src = exercises_repo.fetch_file_contents(
-                    f"exercise_utils/{filename}.py", False
-                )
-                with open(f"{package_root}/{filename}.py", "w", encoding="utf-8") as f:
-                    f.write(ensure_str(exercise_utils_src))
+        # Clear any cached exercise_utils modules to ensure fresh imports
+        _clear_exercise_utils_modules(sources)
 
-            sys.path.insert(0, tmpdir)
+        with _no_bytecode():
+            sys.meta_path.insert(0, finder)
             try:
-                exec(py_file, namespace)
+                exec(
+                    _compile_source(
+                        py_file.sha, py_file_path, py_file.contents.decode("utf-8")
+                    ),
+                    namespace,
+                )
             finally:
-                sys.path.remove(tmpdir)
+                sys.meta_path.remove(finder)
                 # Clean up cached modules again after execution
-                _clear_exercise_utils_modules()
-                sys.dont_write_bytecode = False
+                _clear_exercise_utils_modules(finder.installed_modules)
         return cls(namespace)
 
     def execute_function(
         self, function_name: str, params: Dict[str, Any]
     ) -> Optional[Any]:
         if function_name not in self.namespace:
-            sys.dont_write_bytecode = False
             return None
 
         func = self.namespace[function_name]
         sig = inspect.signature(func)
         valid_params = {k: v for k, v in params.items() if k in sig.parameters}
-        result = self.namespace[function_name](**valid_params)
-        sys.dont_write_bytecode = False
-        return result
+        with _no_bytecode():
+            return func(**valid_params)
 
     def get_variable(
         self,
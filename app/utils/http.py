@@ -0,0 +1,32 @@
+from typing import Optional
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from app.version import __version__
+
+DEFAULT_TIMEOUT = (3, 5)
+
+_session: Optional[Session] = None
+
+
+def get_session() -> Session:
+    """Returns a shared session with connection pooling and retries configured.
+
+    :return: Lazily created, process-wide requests session
+    :rtype: Session
+    """
+    global _session
+    if _session is None:
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = f"gitmastery/{__version__}"
+        _session = session
+    return _session
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from app.version import __version__
+
 
 @dataclass
 class Version:
@@ -36,3 +38,7 @@ class Version:
 
     def __repr__(self) -> str:
         return f"v{self.major}.{self.minor}.{self.patch}"
+
+
+# Parsed once since __version__ is fixed for the lifetime of the process
+CURRENT_VERSION = Version.parse_version_string(__version__)
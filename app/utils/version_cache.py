@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+VERSION_CACHE_PATH = Path.home() / ".gitmastery" / "version_cache.json"
+VERSION_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def get_cached_latest(
+    ttl_seconds: int = VERSION_CACHE_TTL_SECONDS,
+) -> Optional[Tuple[str, bool]]:
+    """Returns the cached latest version and whether it is older than ``ttl_seconds``.
+
+    :param ttl_seconds: Maximum age of the cached entry before it is considered stale
+    :type ttl_seconds: int
+    :return: The cached latest version string and whether it is stale, or None if missing or unreadable
+    :rtype: Optional[Tuple[str, bool]]
+    """
+    try:
+        with open(VERSION_CACHE_PATH, "r") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cache, dict):
+        return None
+
+    latest = cache.get("latest")
+    fetched_at = cache.get("fetched_at")
+    if not isinstance(latest, str) or not isinstance(fetched_at, (int, float)):
+        return None
+
+    return latest, time.time() - fetched_at > ttl_seconds
+
+
+def write_cached_latest(latest: str) -> None:
+    """Atomically writes the latest version to the on-disk cache.
+
+    Failures are ignored since the cache is only an optimization.
+
+    :param latest: Latest version string (e.g. 'v1.2.3')
+    :type latest: str
+    """
+    try:
+        VERSION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=VERSION_CACHE_PATH.parent, prefix=".version_cache", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                json.dump({"latest": latest, "fetched_at": time.time()}, temp_file)
+            os.replace(temp_path, VERSION_CACHE_PATH)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        pass
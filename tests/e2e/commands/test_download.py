@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 
 from ..constants import EXERCISE_NAME
+from ..runner import BinaryRunner
 
 
 def test_download_exercise(downloaded_exercise_dir: Path) -> None:
@@ -18,3 +19,44 @@ def test_download_exercise(downloaded_exercise_dir: Path) -> None:
 def test_download_hands_on(downloaded_hands_on_dir: Path) -> None:
     """download creates the hands-on folder."""
     assert downloaded_hands_on_dir.is_dir()
+
+
+def test_download_exercise_from_tarball(
+    runner: BinaryRunner, tarball_gitmastery_root: Path
+) -> None:
+    """download reads the exercise from the branch archive when fetch_method is tarball."""
+    res = runner.run(["download", EXERCISE_NAME], cwd=tarball_gitmastery_root)
+    res.assert_success()
+
+    exercise_dir = tarball_gitmastery_root / EXERCISE_NAME
+    exercise_config = exercise_dir / ".gitmastery-exercise.json"
+    assert exercise_config.is_file()
+    assert json.loads(exercise_config.read_text())["exercise_name"] == EXERCISE_NAME
+
+    assert (exercise_dir / "README.md").is_file()
+
+
+def test_download_rejects_unknown_fetch_method(
+    runner: BinaryRunner, tmp_path: Path
+) -> None:
+    """download fails with a clear error when the exercises source fetch_method is unknown."""
+    (tmp_path / ".gitmastery.json").write_text(
+        json.dumps(
+            {
+                "progress_local": True,
+                "progress_remote": False,
+                "exercises_source": {
+                    "type": "remote",
+                    "username": "git-mastery",
+                    "repository": "exercises",
+                    "branch": "main",
+                    "fetch_method": "zip",
+                },
+            }
+        )
+    )
+
+    res = runner.run(["download", EXERCISE_NAME], cwd=tmp_path)
+    assert res.returncode != 0
+    res.assert_stdout_contains("Unsupported exercises_source fetch_method: 'zip'")
+    assert not (tmp_path / EXERCISE_NAME).exists()
@@ -1,3 +1,4 @@
+import json
 from collections.abc import Generator
 from pathlib import Path
 
@@ -43,6 +44,21 @@ def gitmastery_root(
     yield from _make_gitmastery_root(runner, tmp_path_factory)
 
 
+@pytest.fixture(scope="session")
+def tarball_gitmastery_root(
+    runner: BinaryRunner, tmp_path_factory: pytest.TempPathFactory
+) -> Generator[Path, None, None]:
+    """
+    Run `setup` in a separate root whose exercises source is fetched as a tarball.
+    """
+    for gitmastery_root_folder in _make_gitmastery_root(runner, tmp_path_factory):
+        config_file = gitmastery_root_folder / ".gitmastery.json"
+        config = json.loads(config_file.read_text())
+        config["exercises_source"]["fetch_method"] = "tarball"
+        config_file.write_text(json.dumps(config, indent=2))
+        yield gitmastery_root_folder
+
+
 @pytest.fixture
 def setup_gitmastery_root(
     runner: BinaryRunner, tmp_path_factory: pytest.TempPathFactory
@@ -1,5 +1,13 @@
+import platform
+
+import pytest
+
 from .runner import BinaryRunner
 
+POSIX_SHELL_ONLY = pytest.mark.skipif(
+    platform.system() == "Windows", reason="Shell commands run through cmd.exe"
+)
+
 
 def test_repl(runner: BinaryRunner) -> None:
     """REPL starts, handles shell commands, and dispatches /command syntax."""
@@ -14,3 +22,54 @@ def test_repl(runner: BinaryRunner) -> None:
     result.assert_stdout_contains("hello_repl_test")
     result.assert_stdout_contains("Git-Mastery app is")
     result.assert_stdout_matches(r"v\d+\.\d+\.\d+")
+
+
+@POSIX_SHELL_ONLY
+def test_repl_shell_state_is_isolated(runner: BinaryRunner) -> None:
+    """Variables and directory changes do not leak between shell command lines."""
+    result = runner.run(
+        [],
+        stdin_text=(
+            "FOO=bar; echo first=[$FOO]\n"
+            'echo "second=[$FOO]"\n'
+            "true; cd / && echo moved=[$(pwd)]\n"
+            'echo "after_cd=[$(pwd)]"\n'
+            "/exit\n"
+        ),
+        timeout=30,
+    )
+    result.assert_success()
+    result.assert_stdout_contains("first=[bar]")
+    result.assert_stdout_contains("second=[]")
+    result.assert_stdout_contains("moved=[/]")
+    result.assert_stdout_matches(r"after_cd=\[/.+\]")
+
+
+def test_repl_continues_after_failing_command(runner: BinaryRunner) -> None:
+    """A failing shell command does not stop later commands from running."""
+    result = runner.run(
+        [],
+        stdin_text="gitmastery_missing_command_xyz\necho after_failure\n/exit\n",
+        timeout=30,
+    )
+    result.assert_success()
+    result.assert_stdout_contains("after_failure")
+
+
+def test_repl_continues_after_unbalanced_quote(runner: BinaryRunner) -> None:
+    """A shell command with an unbalanced quote does not break the REPL."""
+    result = runner.run(
+        [], stdin_text='echo "unterminated\necho after_quote\n/exit\n', timeout=30
+    )
+    result.assert_success()
+    result.assert_stdout_contains("after_quote")
+
+
+def test_repl_dispatches_quoted_arguments(runner: BinaryRunner) -> None:
+    """Quoted command names and arguments are still dispatched to Git-Mastery."""
+    result = runner.run(
+        [], stdin_text='"gitmastery" version\n/version "--help"\n/exit\n', timeout=30
+    )
+    result.assert_success()
+    result.assert_stdout_contains("Git-Mastery app is")
+    result.assert_stdout_contains("Usage: /version")
@@ -1,5 +1,15 @@
+import json
+import re
+import time
+from pathlib import Path
+
+import pytest
+
 from .runner import BinaryRunner
 
+UPGRADE_WARNING = "We strongly recommend upgrading your app."
+STALE_FETCHED_AT = 0.0
+
 
 def test_version(runner: BinaryRunner) -> None:
     """Test the version command output."""
@@ -7,3 +17,48 @@ def test_version(runner: BinaryRunner) -> None:
     res.assert_success()
     res.assert_stdout_contains("Git-Mastery app is")
     res.assert_stdout_matches(r"v\d+\.\d+\.\d+")
+
+
+def _current_version(runner: BinaryRunner) -> str:
+    res = runner.run(["version"])
+    res.assert_success()
+    match = re.search(r"Git-Mastery app is (v\d+\.\d+\.\d+)", res.stdout)
+    assert match is not None, res.stdout
+    return match.group(1)
+
+
+def _run_version_with_cache(
+    runner: BinaryRunner, home: Path, latest: str, fetched_at: float
+) -> str:
+    cache_dir = home / ".gitmastery"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / "version_cache.json").write_text(
+        json.dumps({"latest": latest, "fetched_at": fetched_at})
+    )
+    # USERPROFILE is where Path.home() looks on Windows
+    res = runner.run(["version"], env={"HOME": str(home), "USERPROFILE": str(home)})
+    res.assert_success()
+    return res.stdout
+
+
+@pytest.mark.parametrize("is_stale", [False, True], ids=["fresh", "stale"])
+def test_version_warns_from_cache_when_behind(
+    runner: BinaryRunner, tmp_path: Path, is_stale: bool
+) -> None:
+    """A cached newer release is warned about, whether the cache is fresh or stale."""
+    fetched_at = STALE_FETCHED_AT if is_stale else time.time()
+    stdout = _run_version_with_cache(runner, tmp_path, "v999.0.0", fetched_at)
+    assert "is behind the latest version v999.0.0" in stdout
+    assert UPGRADE_WARNING in stdout
+
+
+@pytest.mark.parametrize("is_stale", [False, True], ids=["fresh", "stale"])
+def test_version_does_not_warn_from_cache_when_current(
+    runner: BinaryRunner, tmp_path: Path, is_stale: bool
+) -> None:
+    """A cached release equal to the running version produces no warning."""
+    fetched_at = STALE_FETCHED_AT if is_stale else time.time()
+    stdout = _run_version_with_cache(
+        runner, tmp_path, _current_version(runner), fetched_at
+    )
+    assert UPGRADE_WARNING not in stdout